@@ -24,7 +24,7 @@ from airflow import DAG
 from airflow.decorators import task
 from airflow.exceptions import AirflowException
 
-from src.deep_parser.config.settings import get_pipeline_config, get_settings
+from src.deep_parser.config.settings import get_settings, get_stage_config
 from src.deep_parser.etl.clean import MarkdownCleaner
 from src.deep_parser.etl.embed import EmbeddingProcessor
 from src.deep_parser.etl.i2t import ImageToTextProcessor
@@ -189,8 +189,8 @@ def clean_markdown(data: dict[str, Any]) -> dict[str, Any]:
     logger.info(f"Cleaning markdown for document: {doc_id}")
 
     try:
-        config = get_pipeline_config()
-        cleaner = MarkdownCleaner(config.clean)
+        config = get_stage_config("clean")
+        cleaner = MarkdownCleaner(config)
         cleaned_text, stats = cleaner.clean(data["raw_markdown"])
 
         data["cleaned_markdown"] = cleaned_text
@@ -222,7 +222,7 @@ def upload_assets_and_replace_links(data: dict[str, Any]) -> dict[str, Any]:
         settings = get_settings()
         image_host = ImageHostService()
         i2t_processor = ImageToTextProcessor(
-            get_pipeline_config().i2t,
+            get_stage_config("i2t"),
             get_llm_service()
         )
 
@@ -253,9 +253,9 @@ def run_i2t(data: dict[str, Any]) -> dict[str, Any]:
         Same dictionary (i2t already done in upload_assets_and_replace_links)
     """
     doc_id = data["doc_id"]
-    config = get_pipeline_config()
+    config = get_stage_config("i2t")
 
-    if not config.i2t.enabled:
+    if not config.enabled:
         logger.info(f"I2T disabled for document: {doc_id}")
         return data
 
@@ -277,8 +277,8 @@ def split_chunks(data: dict[str, Any]) -> dict[str, Any]:
     logger.info(f"Splitting chunks for document: {doc_id}")
 
     try:
-        config = get_pipeline_config()
-        splitter = ChunkSplitter(config.split)
+        config = get_stage_config("split")
+        splitter = ChunkSplitter(config)
         chunks = splitter.split(data["processed_markdown"], doc_id)
 
         data["chunks"] = chunks
@@ -302,9 +302,9 @@ def extract_keywords(data: dict[str, Any]) -> dict[str, Any]:
         Updated dictionary with keywords added to chunks
     """
     doc_id = data["doc_id"]
-    config = get_pipeline_config()
+    config = get_stage_config("keywords")
 
-    if not config.keywords.enabled:
+    if not config.enabled:
         logger.info(f"Keyword extraction disabled for document: {doc_id}")
         return data
 
@@ -312,7 +312,7 @@ def extract_keywords(data: dict[str, Any]) -> dict[str, Any]:
 
     try:
         llm = get_llm_service()
-        extractor = KeywordExtractor(config.keywords, llm)
+        extractor = KeywordExtractor(config, llm)
 
         for chunk in data["chunks"]:
             keywords = extractor.extract(chunk["content"])
@@ -338,9 +338,9 @@ def generate_qas(data: dict[str, Any]) -> dict[str, Any]:
         Updated dictionary with qas added to chunks
     """
     doc_id = data["doc_id"]
-    config = get_pipeline_config()
+    config = get_stage_config("qa")
 
-    if not config.qa.enabled:
+    if not config.enabled:
         logger.info(f"QA generation disabled for document: {doc_id}")
         return data
 
@@ -348,7 +348,7 @@ def generate_qas(data: dict[str, Any]) -> dict[str, Any]:
 
     try:
         llm = get_llm_service()
-        generator = QAGenerator(config.qa, llm)
+        generator = QAGenerator(config, llm)
 
         for chunk in data["chunks"]:
             qas = generator.generate(chunk["content"])
@@ -374,9 +374,9 @@ def summarize_sliding_window(data: dict[str, Any]) -> dict[str, Any]:
         Updated dictionary with summary chunks added
     """
     doc_id = data["doc_id"]
-    config = get_pipeline_config()
+    config = get_stage_config("summary")
 
-    if not config.summary.enabled:
+    if not config.enabled:
         logger.info(f"Summarization disabled for document: {doc_id}")
         return data
 
@@ -384,7 +384,7 @@ def summarize_sliding_window(data: dict[str, Any]) -> dict[str, Any]:
 
     try:
         llm = get_llm_service()
-        summarizer = SlidingWindowSummarizer(config.summary, llm)
+        summarizer = SlidingWindowSummarizer(config, llm)
         summary_chunks = summarizer.summarize(data["chunks"])
 
         data["chunks"].extend(summary_chunks)
@@ -411,9 +411,9 @@ def embed_chunks(data: dict[str, Any]) -> dict[str, Any]:
     logger.info(f"Generating embeddings for document: {doc_id}")
 
     try:
-        config = get_pipeline_config()
+        config = get_stage_config("embed")
         llm = get_llm_service()
-        processor = EmbeddingProcessor(config.embed, llm)
+        processor = EmbeddingProcessor(config, llm)
 
         chunks_with_embeddings = processor.embed_chunks(data["chunks"])
         data["chunks"] = chunks_with_embeddings
@@ -444,9 +444,9 @@ def index_to_stores(data: dict[str, Any]) -> dict[str, Any]:
         async def _index():
             await delete_existing_chunks(doc_id)
 
-            config = get_pipeline_config()
+            config = get_stage_config("index")
             settings = get_settings()
-            index_manager = IndexManager(config.index, settings)
+            index_manager = IndexManager(config, settings)
             await index_manager.index_chunks(data["chunks"], doc_id)
 
         run_async(_index())
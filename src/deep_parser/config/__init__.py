@@ -14,6 +14,7 @@ from deep_parser.config.settings import (
     get_config_dir,
     get_pipeline_config,
     get_settings,
+    get_stage_config,
     load_yaml_config,
 )
 from deep_parser.config.versioned_config import (
@@ -29,6 +30,7 @@ __all__ = [
     "load_yaml_config",
     "get_config_dir",
     "get_pipeline_config",
+    "get_stage_config",
     # Configuration model exports
     "CleanConfig",
     "I2tConfig",
@@ -7,15 +7,20 @@ This module provides:
 - Singleton pattern for settings access
 """
 
+import copy
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal, Type, overload
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Use the libyaml-backed safe loader when PyYAML was built with it; it parses
+# the same documents as yaml.SafeLoader, only faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class CleanConfig(BaseModel):
     """Configuration for text cleaning pipeline stage.
@@ -349,9 +354,39 @@ def get_config_dir() -> Path:
     return current_dir / "config"
 
 
+@lru_cache(maxsize=128)
+def _parse_yaml_cached(content: bytes) -> Dict[str, Any]:
+    """Parse YAML content, memoized on the raw bytes of the file.
+
+    Keying on content rather than on stat fields means an edit always misses
+    the cache, even one that keeps the size and lands within the filesystem's
+    timestamp resolution. Reading the bytes is cheap next to parsing them.
+    """
+    return yaml.load(content, Loader=_YAML_LOADER) or {}
+
+
+def _load_cached_yaml_config(config_name: str) -> Dict[str, Any]:
+    """Load a YAML configuration file, returning the shared cached dict.
+
+    The result must not be mutated; use load_yaml_config() for a private copy.
+    """
+    config_dir = get_config_dir()
+    config_path = config_dir / f"{config_name}.yaml"
+
+    try:
+        content = config_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    return _parse_yaml_cached(content)
+
+
 def load_yaml_config(config_name: str) -> Dict[str, Any]:
     """Load a YAML configuration file from the config directory.
 
+    Parsed files are cached until their content changes; each call returns
+    a deep copy, so callers may mutate the result freely.
+
     Args:
         config_name: Name of the YAML file without extension (e.g., 'clean')
 
@@ -362,14 +397,61 @@ def load_yaml_config(config_name: str) -> Dict[str, Any]:
         FileNotFoundError: If the configuration file does not exist
         yaml.YAMLError: If the YAML file is malformed
     """
-    config_dir = get_config_dir()
-    config_path = config_dir / f"{config_name}.yaml"
+    return copy.deepcopy(_load_cached_yaml_config(config_name))
+
+
+_STAGE_CONFIG_CLASSES: Dict[str, Type[BaseModel]] = {
+    "clean": CleanConfig,
+    "i2t": I2tConfig,
+    "split": SplitConfig,
+    "keywords": KeywordsConfig,
+    "qa": QaConfig,
+    "summary": SummaryConfig,
+    "embed": EmbedConfig,
+    "index": IndexConfig,
+}
+
+
+@overload
+def get_stage_config(stage_name: Literal["clean"]) -> CleanConfig: ...
+@overload
+def get_stage_config(stage_name: Literal["i2t"]) -> I2tConfig: ...
+@overload
+def get_stage_config(stage_name: Literal["split"]) -> SplitConfig: ...
+@overload
+def get_stage_config(stage_name: Literal["keywords"]) -> KeywordsConfig: ...
+@overload
+def get_stage_config(stage_name: Literal["qa"]) -> QaConfig: ...
+@overload
+def get_stage_config(stage_name: Literal["summary"]) -> SummaryConfig: ...
+@overload
+def get_stage_config(stage_name: Literal["embed"]) -> EmbedConfig: ...
+@overload
+def get_stage_config(stage_name: Literal["index"]) -> IndexConfig: ...
+@overload
+def get_stage_config(stage_name: str) -> BaseModel: ...
+
+
+def get_stage_config(stage_name: str) -> BaseModel:
+    """Load and validate the configuration of a single pipeline stage.
+
+    Only the stage's own YAML file is read and only its model is validated,
+    which is cheaper than get_pipeline_config() for callers that need one stage.
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    Args:
+        stage_name: Pipeline stage name (e.g., 'clean', 'embed')
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    Returns:
+        Configuration model for the stage (e.g., CleanConfig for 'clean')
+
+    Raises:
+        KeyError: If stage_name is not a known pipeline stage
+        FileNotFoundError: If the stage configuration file is missing
+        pydantic.ValidationError: If the stage configuration is invalid
+    """
+    config_class = _STAGE_CONFIG_CLASSES[stage_name]
+    # Validation builds new containers, so the cached dict needs no copy here.
+    return config_class(**_load_cached_yaml_config(stage_name))
 
 
 def get_pipeline_config() -> PipelineConfigs:
@@ -382,23 +464,10 @@ def get_pipeline_config() -> PipelineConfigs:
         FileNotFoundError: If any required configuration file is missing
         pydantic.ValidationError: If any configuration is invalid
     """
-    configs: Dict[str, Any] = {}
-
-    config_mappings = {
-        "clean": CleanConfig,
-        "i2t": I2tConfig,
-        "split": SplitConfig,
-        "keywords": KeywordsConfig,
-        "qa": QaConfig,
-        "summary": SummaryConfig,
-        "embed": EmbedConfig,
-        "index": IndexConfig,
+    configs: Dict[str, Any] = {
+        stage_name: get_stage_config(stage_name) for stage_name in _STAGE_CONFIG_CLASSES
     }
 
-    for config_name, config_class in config_mappings.items():
-        config_data = load_yaml_config(config_name)
-        configs[config_name] = config_class(**config_data)
-
     return PipelineConfigs(**configs)
 
 
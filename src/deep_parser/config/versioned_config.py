@@ -4,6 +4,7 @@ This module provides database-backed versioned configuration storage and managem
 allowing configuration changes to be tracked, rolled back, and activated as needed.
 """
 
+import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -14,6 +15,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from deep_parser.models.database import Base
 
+# json.dumps() builds a new JSONEncoder whenever it gets non-default options.
+_json_dumps = json.JSONEncoder(ensure_ascii=False).encode
+
 
 class ConfigVersionModel(Base):
     """SQLAlchemy model for storing configuration versions.
@@ -83,10 +87,8 @@ class ConfigVersionManager:
         Raises:
             sqlalchemy.exc.SQLAlchemyError: If database operation fails
         """
-        import json
-
         config_version_id = str(uuid.uuid4())
-        serialized_data = json.dumps(config_data, ensure_ascii=False)
+        serialized_data = _json_dumps(config_data)
 
         config_version = ConfigVersionModel(
             config_version_id=config_version_id,
@@ -109,8 +111,6 @@ class ConfigVersionManager:
         Raises:
             sqlalchemy.exc.SQLAlchemyError: If database operation fails
         """
-        import json
-
         result = await self.session.execute(
             select(ConfigVersionModel).where(ConfigVersionModel.is_active == True)
         )
@@ -134,8 +134,6 @@ class ConfigVersionManager:
         Raises:
             sqlalchemy.exc.SQLAlchemyError: If database operation fails
         """
-        import json
-
         result = await self.session.execute(
             select(ConfigVersionModel).where(ConfigVersionModel.config_version_id == version_id)
         )
@@ -191,8 +189,6 @@ class ConfigVersionManager:
         Raises:
             sqlalchemy.exc.SQLAlchemyError: If database operation fails
         """
-        import json
-
         result = await self.session.execute(
             select(ConfigVersionModel).order_by(ConfigVersionModel.created_at.desc())
         )
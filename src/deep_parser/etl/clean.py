@@ -23,6 +23,7 @@ class MarkdownCleaner:
             config: CleanConfig containing cleaning rules
         """
         self.config = config
+        self._remove_patterns = [re.compile(pattern, re.MULTILINE) for pattern in config.remove_regex]
 
     def clean(self, markdown_text: str) -> Tuple[str, Dict]:
         """Clean markdown text according to configured rules.
@@ -79,8 +80,8 @@ class MarkdownCleaner:
             Text with regex patterns removed
         """
         result = text
-        for pattern in self.config.remove_regex:
-            result = re.sub(pattern, "", result, flags=re.MULTILINE)
+        for pattern in self._remove_patterns:
+            result = pattern.sub("", result)
         return result
 
     def _apply_contains_rules(self, text: str) -> str:
@@ -10,6 +10,8 @@ from deep_parser.config.settings import I2tConfig
 from deep_parser.logging_config import logger
 from deep_parser.services.llm_service import LLMService
 
+_IMAGE_REF_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
 
 class ImageToTextProcessor:
     """Processor for converting images in markdown to text descriptions."""
@@ -73,7 +75,7 @@ class ImageToTextProcessor:
                 processed_text = processed_text[:insertion_point] + i2t_block + processed_text[insertion_point:]
                 offset = insertion_point + len(i2t_block)
 
-                logger.info(f"Successfully processed image: {ref['path']}")
+                logger.info("Successfully processed image: {}", ref["path"])
 
             except Exception as e:
                 logger.error(f"Error processing image {ref['path']}: {e}")
@@ -90,8 +92,7 @@ class ImageToTextProcessor:
         Returns:
             List of image references with full_match, alt, and path
         """
-        pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-        matches = re.finditer(pattern, markdown_text)
+        matches = _IMAGE_REF_PATTERN.finditer(markdown_text)
         return [
             {"full_match": match.group(0), "alt": match.group(1), "path": match.group(2)}
             for match in matches
@@ -170,12 +171,12 @@ class ImageToTextProcessor:
             Exception: If fallback_mode is 'fail'
         """
         if fallback_mode == "skip":
-            logger.info(f"Skipping image due to error: {ref['path']}")
+            logger.info("Skipping image due to error: {}", ref["path"])
         elif fallback_mode == "empty":
             i2t_block = "\n<i2t>\n</i2t>"
             insertion_point = text.find(ref["full_match"], offset) + len(ref["full_match"])
             text = text[:insertion_point] + i2t_block + text[insertion_point:]
-            logger.info(f"Inserted empty i2t block for: {ref['path']}")
+            logger.info("Inserted empty i2t block for: {}", ref["path"])
         elif fallback_mode == "fail":
             if error:
                 raise error
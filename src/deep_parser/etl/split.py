@@ -14,6 +14,8 @@ from typing import Dict, List, Tuple
 from deep_parser.config.settings import SplitConfig
 from deep_parser.logging_config import logger
 
+_I2T_BLOCK_PATTERN = re.compile(r"<i2t>.*?</i2t>", re.DOTALL)
+
 
 class ChunkSplitter:
     """Split markdown text into chunks based on token count and separators."""
@@ -97,8 +99,7 @@ class ChunkSplitter:
         Returns:
             Tuple of (text_with_placeholders, placeholder_to_content_mapping)
         """
-        i2t_pattern = r"<i2t>.*?</i2t>"
-        matches = re.finditer(i2t_pattern, text, re.DOTALL)
+        matches = _I2T_BLOCK_PATTERN.finditer(text)
 
         mapping = {}
         result = text
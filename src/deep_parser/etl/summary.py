@@ -42,10 +42,10 @@ class SlidingWindowSummarizer:
 
         for level in range(self.config.layers):
             if len(current_chunks) < self.config.window_size:
-                logger.info(f"Layer {level + 1}: Not enough chunks, stopping")
+                logger.info("Layer {}: Not enough chunks, stopping", level + 1)
                 break
 
-            logger.info(f"Processing layer {level + 1} with {len(current_chunks)} chunks")
+            logger.info("Processing layer {} with {} chunks", level + 1, len(current_chunks))
             summaries = await self._generate_layer_summaries(current_chunks, level)
             
             if not summaries:
@@ -54,7 +54,11 @@ class SlidingWindowSummarizer:
             all_summaries.extend(summaries)
             current_chunks = summaries
 
-        logger.info(f"Generated {len(all_summaries)} summaries across {len([s for s in all_summaries if s['level'] == 0]) + 1} layers")
+        logger.opt(lazy=True).info(
+            "Generated {} summaries across {} layers",
+            lambda: len(all_summaries),
+            lambda: len([s for s in all_summaries if s["level"] == 0]) + 1,
+        )
         return all_summaries
 
     async def _generate_layer_summaries(
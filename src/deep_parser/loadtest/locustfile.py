@@ -5,6 +5,7 @@ supporting distributed load testing scenarios.
 """
 
 import os
+import random
 from typing import Any
 
 from locust import HttpUser, between, task
@@ -62,7 +63,6 @@ class DeepParserUser(HttpUser):
         if not self.queries:
             return
 
-        import random
         query = random.choice(self.queries)
 
         request_body: dict[str, Any] = {
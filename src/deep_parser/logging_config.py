@@ -1,17 +1,71 @@
+import gzip
 import os
+import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+
 from loguru import logger
 
+# Bound/contextualized keys rendered in front of each message, in this order.
+_CONTEXT_KEYS = ("component", "correlation_id")
+
+
+class _PerSecondTimeFormat:
+    """Loguru format callable that renders the record time once per second.
+
+    Formatting ``{time:YYYY-MM-DD HH:mm:ss}`` costs several microseconds per
+    record; records logged within the same second reuse the rendered format.
+
+    Args:
+        template: Loguru format with a single ``%s`` where the time goes
+    """
+
+    def __init__(self, template: str):
+        self._template = template + "\n{exception}"
+        self._cache = (None, "")
+
+    def __call__(self, record) -> str:
+        time = record["time"]
+        second = int(time.timestamp())
+        cached_second, rendered = self._cache
+        if second != cached_second:
+            rendered = self._template % time.strftime("%Y-%m-%d %H:%M:%S")
+            # Single tuple assignment so concurrent callers never see a
+            # second paired with another second's rendering.
+            self._cache = (second, rendered)
+        return rendered
+
+
+def _render_log_context(record) -> None:
+    # Collapse the context keys into one always-present private field so the
+    # sink formats can reference it without clobbering a caller's own extra;
+    # records without context render it empty.
+    extra = record["extra"]
+    context = " ".join(f"{key}={extra[key]}" for key in _CONTEXT_KEYS if key in extra)
+    extra["_ctx"] = f"[{context}] " if context else ""
+
+
+def _compress_rotated_log(path: str) -> None:
+    # Level 1 DEFLATE: text logs still shrink to a few percent of their size,
+    # at a fraction of the CPU cost of the default level 9.
+    with open(path, "rb") as f_in, gzip.open(f"{path}.gz", "wb", compresslevel=1) as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(path)
+
 
 def configure_logging() -> None:
     log_level = os.getenv("LOG_LEVEL", "INFO")
     
     logger.remove()
+    logger.configure(patcher=_render_log_context)
     
     logger.add(
         sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        format=_PerSecondTimeFormat(
+            "<green>%s</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{extra[_ctx]}{message}</level>"
+        ),
         level=log_level,
         colorize=True,
     )
@@ -21,12 +75,53 @@ def configure_logging() -> None:
     
     logger.add(
         log_dir / "deep_parser.log",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        format=_PerSecondTimeFormat("%s | {level: <8} | {name}:{function}:{line} - {extra[_ctx]}{message}"),
         level=log_level,
         rotation="10 MB",
         retention="7 days",
-        compression="zip",
+        compression=_compress_rotated_log,
     )
 
 
-__all__ = ["logger", "configure_logging"]
+@lru_cache(maxsize=1024)
+def get_logger(component: Optional[str] = None, correlation_id: Optional[str] = None):
+    """Get a logger bound to a component and correlation ID.
+
+    Bound loggers share the sinks installed by configure_logging(), so they
+    stay valid across reconfiguration and can be memoized per context. Both
+    sinks render the bound values in front of the message, e.g.
+    ``[component=etl correlation_id=req-1] message``.
+
+    Args:
+        component: Name of the component emitting the records
+        correlation_id: Identifier used to correlate records of one request
+
+    Returns:
+        Loguru logger whose extra holds the given ``component`` and
+        ``correlation_id``; keys left as None are not bound
+    """
+    context = {}
+    if component is not None:
+        context["component"] = component
+    if correlation_id is not None:
+        context["correlation_id"] = correlation_id
+    return logger.bind(**context)
+
+
+def correlation_context(correlation_id: str):
+    """Attach a correlation ID to every record logged in the current context.
+
+    The ID is kept in a context variable rather than on a logger, so plain
+    ``logger`` calls made while the context is active, including from tasks
+    created inside it, carry the ID without a new logger per request.
+
+    Args:
+        correlation_id: Identifier used to correlate records of one request
+
+    Returns:
+        Context manager that restores the previous context on exit
+    """
+    return logger.contextualize(correlation_id=correlation_id)
+
+
+__all__ = ["logger", "configure_logging", "get_logger", "correlation_context"]
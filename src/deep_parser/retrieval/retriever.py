@@ -130,7 +130,7 @@ class RetrieverService:
                     logger.error(f"Route {route_name} failed: {result}")
                 else:
                     results_by_route[route_name] = result
-                    logger.info(f"Route {route_name} returned {len(result)} results")
+                    logger.info("Route {} returned {} results", route_name, len(result))
 
         # Fusion of results
         if len(results_by_route) > 1:
@@ -1,31 +1,53 @@
 """Shared test fixtures for Deep Parser tests."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from deep_parser.main import app
 from deep_parser.models.database import Base, get_async_session
 
 
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:memdb1?mode=memory&cache=shared&uri=true"
 
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-TestSessionLocal = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+# The in-memory database lives only as long as a connection is open, so pin
+# the engine to a single connection for the whole session.
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+    poolclass=StaticPool,
+    connect_args={"uri": True},
+)
+
+
+# pysqlite starts transactions lazily and breaks SAVEPOINT semantics; let
+# SQLAlchemy emit BEGIN itself so per-test savepoints roll back cleanly.
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    # pytest-asyncio creates every test and fixture loop from this policy.
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest.fixture(autouse=True)
-async def setup_database():
+@pytest.fixture(scope="session", autouse=True)
+async def _schema():
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -33,13 +55,36 @@ async def setup_database():
         await conn.run_sync(Base.metadata.drop_all)
 
 
-async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with TestSessionLocal() as session:
-        yield session
+@pytest.fixture
+async def async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Session inside a per-test transaction that is rolled back afterwards.
+
+    Commits made by the code under test only release a SAVEPOINT, so nothing
+    leaks into the next test.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
 
 
 @pytest.fixture
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
+async def async_client(async_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    # Imported here so collecting tests that never hit the API does not pull in
+    # the whole application (every router and its service dependencies).
+    from deep_parser.main import app
+
+    async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
+        yield async_session
+
     app.dependency_overrides[get_async_session] = override_get_session
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
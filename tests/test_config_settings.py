@@ -0,0 +1,78 @@
+"""Tests for YAML configuration loading in deep_parser.config.settings."""
+
+import os
+
+import pytest
+
+from deep_parser.config import settings
+from deep_parser.config.settings import (
+    CleanConfig,
+    EmbedConfig,
+    I2tConfig,
+    IndexConfig,
+    KeywordsConfig,
+    QaConfig,
+    SplitConfig,
+    SummaryConfig,
+    get_stage_config,
+    load_yaml_config,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Point the YAML loaders at an empty temporary config directory."""
+    monkeypatch.setattr(settings, "get_config_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def test_load_yaml_config_sees_same_size_rewrite(config_dir):
+    config_file = config_dir / "clean.yaml"
+    config_file.write_text("enabled: true\n", encoding="utf-8")
+    assert load_yaml_config("clean") == {"enabled": True}
+    stat = config_file.stat()
+
+    # Same size and, as on a filesystem with coarse timestamps, same mtime.
+    config_file.write_text("enabled: null\n", encoding="utf-8")
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert load_yaml_config("clean") == {"enabled": None}
+
+
+def test_load_yaml_config_returns_private_copy(config_dir):
+    (config_dir / "clean.yaml").write_text("remove_patterns:\n  - foo\n", encoding="utf-8")
+
+    first = load_yaml_config("clean")
+    first["remove_patterns"].append("bar")
+    first["enabled"] = False
+
+    assert load_yaml_config("clean") == {"remove_patterns": ["foo"]}
+
+
+def test_load_yaml_config_missing_file(config_dir):
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        load_yaml_config("missing")
+
+
+@pytest.mark.parametrize(
+    ("stage_name", "config_class"),
+    [
+        ("clean", CleanConfig),
+        ("i2t", I2tConfig),
+        ("split", SplitConfig),
+        ("keywords", KeywordsConfig),
+        ("qa", QaConfig),
+        ("summary", SummaryConfig),
+        ("embed", EmbedConfig),
+        ("index", IndexConfig),
+    ],
+)
+def test_get_stage_config_returns_stage_model(config_dir, stage_name, config_class):
+    (config_dir / f"{stage_name}.yaml").write_text("", encoding="utf-8")
+
+    assert type(get_stage_config(stage_name)) is config_class
+
+
+def test_get_stage_config_unknown_stage(config_dir):
+    with pytest.raises(KeyError):
+        get_stage_config("unknown")
@@ -0,0 +1,85 @@
+"""Tests for the loguru sink configuration in deep_parser.logging_config."""
+
+import io
+import sys
+
+import pytest
+
+from deep_parser.logging_config import configure_logging, correlation_context, get_logger, logger
+
+
+@pytest.fixture
+def read_logs(tmp_path, monkeypatch):
+    """Configure the real sinks in a temp directory; returns a reader for (stderr, file)."""
+    # The console sink keeps the stream it was added with, so give it one that
+    # outlives pytest's per-phase capture.
+    stderr = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", stderr)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    configure_logging()
+
+    def read() -> tuple[str, str]:
+        # Removing the sinks closes the log file.
+        logger.remove()
+        log_file = tmp_path / "logs" / "deep_parser.log"
+        return stderr.getvalue(), log_file.read_text(encoding="utf-8")
+
+    yield read
+    logger.remove()
+
+
+def test_get_logger_renders_bound_context(read_logs):
+    get_logger(component="etl", correlation_id="req-1").info("hello")
+
+    stderr, log_file = read_logs()
+
+    for output in (stderr, log_file):
+        assert "[component=etl correlation_id=req-1] hello" in output
+
+
+def test_correlation_context_renders_id(read_logs):
+    with correlation_context("req-2"):
+        logger.info("inside")
+    logger.info("outside")
+
+    stderr, log_file = read_logs()
+
+    for output in (stderr, log_file):
+        assert "[correlation_id=req-2] inside" in output
+        (outside_line,) = [line for line in output.splitlines() if "outside" in line]
+        assert "req-2" not in outside_line
+
+
+def test_record_without_context_renders_plain_message(read_logs):
+    logger.info("plain message")
+
+    stderr, log_file = read_logs()
+
+    assert " - plain message" in log_file
+    assert "[" not in log_file.split(" - ", 1)[1]
+    assert "plain message" in stderr
+
+
+def test_configure_logging_reinstalls_removed_sinks(read_logs, monkeypatch):
+    stderr = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", stderr)
+    logger.remove()
+    configure_logging()
+    logger.info("after reconfigure")
+
+    _, log_file = read_logs()
+
+    assert "after reconfigure" in stderr.getvalue()
+    assert "after reconfigure" in log_file
+
+
+def test_caller_context_extra_is_preserved(read_logs):
+    records = []
+    logger.add(lambda message: records.append(message.record["extra"]), level="INFO")
+
+    logger.bind(context="caller", correlation_id="req-3").info("with extra")
+    _, log_file = read_logs()
+
+    assert records[0]["context"] == "caller"
+    assert "[correlation_id=req-3] with extra" in log_file
@@ -0,0 +1,18 @@
+"""Tests for the serialization used by ConfigVersionManager."""
+
+import json
+import math
+
+from deep_parser.config.versioned_config import _json_dumps
+
+
+def test_stored_config_data_decodes_to_saved_values():
+    data = {"threshold": float("nan"), "limit": float("inf"), "seed": 2**70, "name": "café"}
+
+    loaded = json.loads(_json_dumps(data))
+
+    assert math.isnan(loaded["threshold"])
+    assert loaded["limit"] == float("inf")
+    assert loaded["seed"] == 2**70
+    assert isinstance(loaded["seed"], int)
+    assert loaded["name"] == "café"